@@ -2,14 +2,21 @@
 
 from __future__ import annotations
 
+import os
 import re
-from dataclasses import dataclass, field
-from pathlib import Path
-from textwrap import dedent, indent
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache, lru_cache
 from typing import TYPE_CHECKING, Literal, cast
 
 import mkdocs.config.config_options as opt
 import yaml
+
+try:
+    # libyaml's C emitter, when available, is several times faster
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:  # pragma: no cover
+    from yaml import SafeDumper as _YamlDumper  # type: ignore [assignment]
+
 from mkdocs.config import Config
 from mkdocs.config.defaults import get_schema
 from mkdocs.plugins import BasePlugin, get_plugin_logger
@@ -18,7 +25,8 @@ from mkdocs.structure.nav import Section
 from mkdocs.structure.pages import Page
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator, Sequence
+    from collections.abc import Callable, Iterator, Sequence
+    from pathlib import Path
 
     from mkdocs.config.config_options import Plugins
     from mkdocs.config.defaults import MkDocsConfig
@@ -26,6 +34,8 @@ if TYPE_CHECKING:
     from mkdocs.structure.nav import Navigation
 
     WarnRaiseSkip = Literal["warn", "raise", "skip"]
+    # (name_parts, docs_path, dotted module path, markdown content)
+    _ModuleContent = tuple[tuple[str, ...], str, str, str]
 
 
 PLUGIN_NAME = "api-autonav"  # must match [project.entry-points."mkdocs.plugins"]
@@ -33,6 +43,13 @@ PLUGIN_NAME = "api-autonav"  # must match [project.entry-points."mkdocs.plugins"
 # empty code block that renders as [mod] symbol
 MOD_SYMBOL = '<code class="doc-symbol doc-symbol-nav doc-symbol-module"></code>'
 
+# template for the generated virtual markdown files
+# filled with (title, h1, module identifier, indented options block)
+_MODULE_MD_TEMPLATE = "---\ntitle: %s\n---\n%s\n\n::: %s\n%s"
+
+# below this many modules, thread-pool overhead outweighs the gain
+_PARALLEL_THRESHOLD = 64
+
 logger = get_plugin_logger(PLUGIN_NAME)
 
 
@@ -66,6 +83,29 @@ class AutoAPIPlugin(BasePlugin[PluginConfig]):  # type: ignore [no-untyped-call]
 
     nav: _NavNode
     _uses_awesome_nav: bool = False
+    _is_serve: bool = False
+    # (config signature, source-tree fingerprint, cached module contents)
+    _serve_cache: tuple[tuple, int, list[_ModuleContent]] | None = None
+    # (config signature, mod_path -> markdown); unlike _serve_cache, entries
+    # stay valid across source edits since content depends only on config
+    _content_cache: tuple[tuple, dict[str, str]] | None = None
+    # preprocessed config.exclude structures, built once in on_config
+    _exclude_exact: frozenset[str] = frozenset()
+    _exclude_prefixes: tuple[str, ...] = ()
+    _exclude_re: re.Pattern | None = None
+    # config.module_options keys compiled once, in config order
+    _module_option_rules: tuple[tuple[re.Pattern, dict], ...] | None = None
+
+    def on_startup(
+        self, *, command: Literal["build", "gh-deploy", "serve"], dirty: bool
+    ) -> None:
+        """First event on startup.
+
+        Defining this method also tells mkdocs to keep this plugin instance
+        alive across `mkdocs serve` rebuilds, which lets us reuse discovery
+        results when the source tree hasn't changed.
+        """
+        self._is_serve = command == "serve"
 
     def on_config(self, config: MkDocsConfig) -> MkDocsConfig | None:
         """First event called on build. Run right after the user config is loaded."""
@@ -74,27 +114,57 @@ class AutoAPIPlugin(BasePlugin[PluginConfig]):  # type: ignore [no-untyped-call]
         self._uses_awesome_nav = "awesome-nav" in config.plugins
 
         if "mkdocstrings" not in config.plugins:
-            for name, option in get_schema():
-                if name == "plugins":
-                    plugins_option = cast("Plugins", option)
-                    plugins_option.load_plugin_with_namespace("mkdocstrings", {})
-                    logger.warning(
-                        "'mkdocstrings' wasn't found in the plugins list. "
-                        f"It has been added automatically by {PLUGIN_NAME}.\nPlease "
-                        "ensure that 'mkdocstrings' is added to the plugins list."
-                    )
-                    # this adds the mkdocstrings plugin to the config['plugins']
-                    # but should we add it to config['plugins'] explicitly?
-                    break
+            plugins_option = cast("Plugins", dict(get_schema())["plugins"])
+            plugins_option.load_plugin_with_namespace("mkdocstrings", {})
+            logger.warning(
+                "'mkdocstrings' wasn't found in the plugins list. "
+                f"It has been added automatically by {PLUGIN_NAME}.\nPlease "
+                "ensure that 'mkdocstrings' is added to the plugins list."
+            )
+            # this adds the mkdocstrings plugin to the config['plugins']
+            # but should we add it to config['plugins'] explicitly?
 
         self.nav = _NavNode(
             name_prefix=self.config.nav_item_prefix,
             title=self.config.nav_section_title,
             show_full_namespace=self.config.show_full_namespace,
         )
+
+        # Preprocess exclude patterns once per build (rather than in on_files,
+        # which would recompile on every serve rebuild):
+        # - plain entries become an exact-match set plus a tuple of dotted
+        #   prefixes (str.startswith accepts a tuple and short-circuits in C)
+        # - `re:` entries are combined into a single alternation, so one
+        #   C-level search replaces one call per pattern per module
+        exclude_exact: set[str] = set()
+        raw_patterns: list[str] = []
+        for pattern in self.config.exclude:
+            if pattern.startswith("re:"):
+                # Regex pattern
+                try:
+                    re.compile(pattern[3:])
+                except re.error:  # pragma: no cover
+                    logger.error("Invalid regex pattern: %s", pattern[3:])
+                else:
+                    raw_patterns.append(pattern[3:])
+            else:
+                # Direct module path
+                exclude_exact.add(pattern)
+        self._exclude_exact = frozenset(exclude_exact)
+        self._exclude_prefixes = tuple(f"{x}." for x in exclude_exact)
+        self._exclude_re = (
+            re.compile("|".join(f"(?:{p})" for p in raw_patterns))
+            if raw_patterns
+            else None
+        )
+        self._module_option_rules = tuple(
+            (_compile(key), value) for key, value in self.config.module_options.items()
+        )
         return None
 
-    def _module_markdown(self, parts: tuple[str, ...]) -> str:
+    def _module_markdown(
+        self, parts: tuple[str, ...], mod_identifier: str | None = None
+    ) -> str:
         """Create the content for the virtual file.
 
         Example
@@ -107,12 +177,20 @@ class AutoAPIPlugin(BasePlugin[PluginConfig]):  # type: ignore [no-untyped-call]
 
         ::: top_module.sub.sub_sub
         """
-        mod_identifier = ".".join(parts)  # top_module.sub.sub_sub
+        if mod_identifier is None:
+            mod_identifier = ".".join(parts)  # top_module.sub.sub_sub
         options = {"heading_level": 1}  # very useful default... but can be overridden
-        for option in self.config.module_options:
-            if re.match(option, mod_identifier):
+        if (rules := self._module_option_rules) is None:
+            # on_config compiles these once per build; compile lazily here so
+            # the method also works on a bare plugin instance (e.g. in tests)
+            rules = tuple(
+                (_compile(key), value)
+                for key, value in self.config.module_options.items()
+            )
+        for pattern, module_options in rules:
+            if pattern.match(mod_identifier):
                 # if the option is a regex, it matches the module identifier
-                options.update(self.config.module_options[option])
+                options.update(module_options)
 
         # create the actual markdown that will go into the virtual file
         if int(options.get("heading_level", 1)) > 1:
@@ -121,18 +199,17 @@ class AutoAPIPlugin(BasePlugin[PluginConfig]):  # type: ignore [no-untyped-call]
             h1 = ""
             options.setdefault("show_root_heading", True)
 
-        md = f"""
-        ---
-        title: {self._display_title(parts)}
-        ---
-        {h1}
-
-        ::: {mod_identifier}
-        """
-
-        options_str = yaml.dump({"options": options}, default_flow_style=False)
-        md = dedent(md).lstrip() + indent(options_str, "    ")
-        return md
+        # the overwhelmingly common case is the fixed default options, which
+        # can be formatted without invoking yaml at all
+        if (options_str := _default_options_yaml(options)) is None:
+            try:
+                options_str = _dump_options(tuple(sorted(options.items())))
+            except TypeError:  # unhashable option values
+                options_str = yaml.dump({"options": options}, default_flow_style=False)
+        # indent the options block under the mkdocstrings directive
+        options_str = "    " + options_str.rstrip("\n").replace("\n", "\n    ") + "\n"
+        title = mod_identifier if self.config.show_full_namespace else parts[-1]
+        return _MODULE_MD_TEMPLATE % (title, h1, mod_identifier, options_str)
 
     def on_files(self, files: Files, /, *, config: MkDocsConfig) -> None:
         """Called after the files collection is populated from the `docs_dir`.
@@ -140,67 +217,143 @@ class AutoAPIPlugin(BasePlugin[PluginConfig]):  # type: ignore [no-untyped-call]
         Here we generate the virtual files that will be used to render the API
         (each )
         """
+        # exclusion structures are preprocessed once in on_config
+        exclude_exact = self._exclude_exact
+        exclude_prefixes = self._exclude_prefixes
+        exclude_re = self._exclude_re
+
+        def _prune(parts: tuple[str, ...]) -> bool:
+            mod = ".".join(parts)
+            return mod in exclude_exact or mod.startswith(exclude_prefixes)
+
+        # when there are direct path excludes, let the walker prune whole
+        # subtrees before they are ever scanned
+        is_excluded = _prune if exclude_exact else None
+
+        # hoist attribute lookups that would otherwise repeat per module
+        api_root_uri = self.config.api_root_uri
+        on_implicit_ns = self.config.on_implicit_namespace_package
         exclude_private = self.config.exclude_private
-        exclude_patterns: list[re.Pattern] = []
-        exclude_paths: list[str] = []
-
-        # Preprocess exclude patterns
-        for pattern in self.config.exclude:
-            if pattern.startswith("re:"):
-                # Regex pattern
-                try:
-                    exclude_patterns.append(re.compile(pattern[3:]))
-                except re.error:  # pragma: no cover
-                    logger.error("Invalid regex pattern: %s", pattern[3:])
-            else:
-                # Direct module path
-                exclude_paths.append(pattern)
-
-        # for each top-level module specified in plugins.api-autonav.modules
-        for module in self.config.modules:
-            # iterate (recursively) over all modules in the package
-            for name_parts, docs_path in _iter_modules(
-                module,
-                self.config.api_root_uri,
-                self.config.on_implicit_namespace_package,  # type: ignore [arg-type]
+        uses_awesome_nav = self._uses_awesome_nav
+        module_markdown = self._module_markdown
+        add_path = self.nav.add_path
+        append_file = files.append
+
+        # Under `mkdocs serve`, discovery and markdown generation can be
+        # reused across rebuilds as long as neither the relevant config nor
+        # the source tree (names/mtimes) has changed.
+        cache_sig: tuple = ()
+        fingerprint = 0
+        contents: list[_ModuleContent] | None = None
+        if self._is_serve:
+            cache_sig = (
+                tuple(str(m) for m in self.config.modules),
+                tuple(self.config.exclude),
+                exclude_private,
+                api_root_uri,
+                self.config.show_full_namespace,
+                repr(self.config.module_options),
+                on_implicit_ns,
+                uses_awesome_nav,
+            )
+            fingerprint = _tree_fingerprint(self.config.modules)
+            if self._serve_cache is not None and self._serve_cache[:2] == (
+                cache_sig,
+                fingerprint,
             ):
-                # parts looks like -> ('top_module', 'sub', 'sub_sub')
-                # docs_path looks like -> api_root_uri/top_module/sub/sub_sub/index.md
-                #   and refers to the location in the BUILT site directory
-
-                # Check exclusion conditions
-                if exclude_private and any(part.startswith("_") for part in name_parts):
-                    continue
-
-                # Check direct path exclusions
-                mod_path = ".".join(name_parts)
-                if any(mod_path == x or mod_path.startswith(x) for x in exclude_paths):
-                    logger.info("Excluding   %r due to config.exclude", mod_path)
-                    continue
-
-                # Check regex exclusions
-                if any(pattern.search(mod_path) for pattern in exclude_patterns):
-                    logger.info("Excluding   %r due to config.exclude", mod_path)
-                    continue
-
-                # create the actual markdown that will go into the virtual file
-                content = self._module_markdown(name_parts)
-
-                # generate a mkdocs File object and add it to the collection
-                logger.info("Documenting %r in virtual file: %s", mod_path, docs_path)
-                file = File.generated(config, src_uri=docs_path, content=content)
-                if file.src_uri in files.src_uris:  # pragma: no cover
-                    files.remove(file)
-                files.append(file)
-                if self._uses_awesome_nav and docs_path.endswith("index.md"):
-                    # https://lukasgeiter.github.io/mkdocs-awesome-nav/features/titles/
-                    nav_path = docs_path.replace("index.md", ".nav.yml")
-                    content = f"title: {self._display_title(name_parts)}\n"
-                    nav_yml = File.generated(config, src_uri=nav_path, content=content)
-                    files.append(nav_yml)
-
-                # update our navigation tree
-                self.nav.add_path(name_parts, docs_path, file=file)
+                contents = self._serve_cache[2]
+                logger.debug("Reusing cached API discovery results")
+
+        if contents is None:
+            n_excluded = 0
+            to_emit: list[tuple[tuple[str, ...], str, str]] = []
+            # for each top-level module specified in plugins.api-autonav.modules
+            for module in self.config.modules:
+                # iterate (recursively) over all modules in the package
+                for name_parts, docs_path, mod_path in _iter_modules(
+                    module,
+                    api_root_uri,
+                    on_implicit_ns,  # type: ignore [arg-type]
+                    exclude_private=exclude_private,
+                    is_excluded=is_excluded,
+                ):
+                    # parts looks like -> ('top_module', 'sub', 'sub_sub')
+                    # docs_path looks like ->
+                    #   api_root_uri/top_module/sub/sub_sub/index.md
+                    #   and refers to the location in the BUILT site directory
+
+                    # Check direct path exclusions (exact match or parent package)
+                    if mod_path in exclude_exact or mod_path.startswith(
+                        exclude_prefixes
+                    ):
+                        logger.debug("Excluding   %r due to config.exclude", mod_path)
+                        n_excluded += 1
+                        continue
+
+                    # Check regex exclusions
+                    if exclude_re is not None and exclude_re.search(mod_path):
+                        logger.debug("Excluding   %r due to config.exclude", mod_path)
+                        n_excluded += 1
+                        continue
+
+                    to_emit.append((name_parts, docs_path, mod_path))
+
+            if n_excluded:
+                logger.info("Excluded %d modules due to config.exclude", n_excluded)
+
+            # under serve, a source edit invalidates the tree fingerprint but
+            # not the markdown itself; reuse per-module strings when only the
+            # tree changed, regenerating just the additions
+            cached_md: dict[str, str] = {}
+            if self._content_cache is not None and self._content_cache[0] == cache_sig:
+                cached_md = self._content_cache[1]
+
+            def _markdown(item: tuple[tuple[str, ...], str, str]) -> str:
+                md = cached_md.get(item[2])
+                if md is None:
+                    md = module_markdown(item[0], item[2])
+                return md
+
+            # building the markdown is independent per module; for large
+            # packages, spread it across a thread pool (executor.map preserves
+            # order, so nav insertion below remains deterministic)
+            if len(to_emit) >= _PARALLEL_THRESHOLD:
+                with ThreadPoolExecutor() as pool:
+                    markdowns = list(pool.map(_markdown, to_emit))
+            else:
+                markdowns = [_markdown(item) for item in to_emit]
+
+            contents = [(*item, md) for item, md in zip(to_emit, markdowns)]
+            if self._is_serve:
+                self._serve_cache = (cache_sig, fingerprint, contents)
+                self._content_cache = (cache_sig, {c[2]: c[3] for c in contents})
+
+        # mkdocs>=1.6 backs Files with a dict, so membership is O(1) and
+        # remove is only paid on an actual collision; grab the mapping once
+        existing_uris = files.src_uris
+        for name_parts, docs_path, mod_path, content in contents:
+            # generate a mkdocs File object and add it to the collection
+            logger.debug("Documenting %r in virtual file: %s", mod_path, docs_path)
+            file = File.generated(config, src_uri=docs_path, content=content)
+            if file.src_uri in existing_uris:  # pragma: no cover
+                files.remove(file)
+            append_file(file)
+            if uses_awesome_nav and docs_path.endswith("index.md"):
+                # https://lukasgeiter.github.io/mkdocs-awesome-nav/features/titles/
+                # pre-encode: this file is written verbatim via content_bytes,
+                # so passing bytes skips the utf-8 encode at write time
+                nav_path = docs_path.replace("index.md", ".nav.yml")
+                title = f"title: {self._display_title(name_parts)}\n"
+                nav_yml = File.generated(
+                    config, src_uri=nav_path, content=title.encode("utf-8")
+                )
+                append_file(nav_yml)
+
+            # update our navigation tree
+            add_path(name_parts, docs_path, file=file)
+
+        # a single summary line rather than one log record per module
+        logger.info("Generated %d virtual API documentation files", len(contents))
 
         # TODO: it's probably better to do this in the on_nav method
         # Render the navigation tree to dict and add to config['nav']
@@ -209,7 +362,7 @@ class AutoAPIPlugin(BasePlugin[PluginConfig]):  # type: ignore [no-untyped-call]
                 cfg_nav,
                 self.config.nav_section_title,
                 self.nav.as_dict(),
-                self.config.api_root_uri,
+                api_root_uri,
             )
         # note, if there is NO existing nav, then mkdocs will
         # find the pages and include them in the nav automatically
@@ -231,13 +384,11 @@ class AutoAPIPlugin(BasePlugin[PluginConfig]):  # type: ignore [no-untyped-call]
                     break
         return nav
 
-    def _display_title(self, parts: Sequence[str]) -> str:
-        if self.config.show_full_namespace:
-            return ".".join(parts)
-        return parts[-1]
+    def _display_title(self, parts: tuple[str, ...]) -> str:
+        return _display_title(parts, self.config.show_full_namespace)
 
     def _fix_nav_item(self, item: StructureItem) -> None:
-        """Recursively fix titles of members in section.
+        """Fix titles of members in section (iteratively, parents first).
 
         Section(title='Reference')
             Section(title='Module')
@@ -247,75 +398,168 @@ class AutoAPIPlugin(BasePlugin[PluginConfig]):  # type: ignore [no-untyped-call]
             Section(title='{prefix}module')
                 Page(title='{prefix}module', url='/reference/module/')
         """
-        if isinstance(item, Section):
-            parts = []
-            # make sure that Section titles *also* obey the full namespace rules
-            if self.config.show_full_namespace:
-                parts = [
-                    x.title.split(">")[-1]
-                    for x in list(item.ancestors)[:-1]
-                    if isinstance(x, Section)
-                ]
-            parts.append(item.title.lower())
-            title = ".".join(parts).replace(" ", "_")
-            item.title = f"{self.config.nav_item_prefix}{title}"
-            for child in item.children:
-                self._fix_nav_item(child)
-        elif isinstance(item, Page):
-            if not item.title:
-                parts = item.url.split("/")
-                item.meta["title"] = f"{self.config.nav_item_prefix}{parts[-2]}"
+        nav_item_prefix = self.config.nav_item_prefix
+        show_full_namespace = self.config.show_full_namespace
+        stack: list[StructureItem] = [item]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, Section):
+                parts = []
+                # make sure that Section titles *also* obey the full namespace rules
+                if show_full_namespace:
+                    parts = [
+                        x.title.split(">")[-1]
+                        for x in list(item.ancestors)[:-1]
+                        if isinstance(x, Section)
+                    ]
+                parts.append(item.title.lower())
+                title = ".".join(parts).replace(" ", "_")
+                item.title = f"{nav_item_prefix}{title}"
+                stack.extend(item.children)
+            elif isinstance(item, Page):
+                if not item.title:
+                    parts = item.url.split("/")
+                    item.meta["title"] = f"{nav_item_prefix}{parts[-2]}"
 
 
 # -----------------------------------------------------------------------------
 
 
+@cache
+def _compile(pattern: str) -> re.Pattern:
+    """Compile a regex pattern, caching the result across calls."""
+    return re.compile(pattern)
+
+
+@cache
+def _display_title(parts: tuple[str, ...], show_full_namespace: bool) -> str:
+    """Return the display title for a module, cached by its parts."""
+    return ".".join(parts) if show_full_namespace else parts[-1]
+
+
+# keys that yaml.dump emits verbatim, without quoting or escaping
+_PLAIN_KEY = re.compile(r"[A-Za-z_][A-Za-z0-9_]*$").match
+
+
+def _default_options_yaml(options: dict) -> str | None:
+    """Hand-format simple mkdocstrings options, skipping the YAML emitter.
+
+    Returns the same YAML that yaml.dump would produce for flat dicts of
+    bool/int values under identifier-like keys (which covers the defaults
+    this plugin sets, e.g. {'heading_level': N}), or None when user
+    overrides require a real YAML dump.
+    """
+    lines = ["options:"]
+    # keys emitted in sorted order, matching yaml.dump's sort_keys default
+    for key in sorted(options):
+        if not isinstance(key, str) or _PLAIN_KEY(key) is None:
+            return None
+        value = options[key]
+        # bool first: it is an int subclass but renders differently
+        if type(value) is bool:
+            lines.append(f"  {key}: {'true' if value else 'false'}")
+        elif type(value) is int:
+            lines.append(f"  {key}: {value}")
+        else:
+            return None
+    return "\n".join(lines) + "\n"
+
+
+@lru_cache(maxsize=256)
+def _dump_options(items: tuple) -> str:
+    """Serialize mkdocstrings options as YAML, cached by option items.
+
+    In the common case every module shares the same options, so the
+    (relatively expensive) yaml.dump runs only once per distinct set.
+    """
+    return yaml.dump(
+        {"options": dict(items)}, Dumper=_YamlDumper, default_flow_style=False
+    )
+
+
 def _iter_modules(
     root_module: Path | str,
     docs_root: str,
     on_implicit_namespace_package: WarnRaiseSkip,
-) -> Iterator[tuple[tuple[str, ...], str]]:
+    *,
+    exclude_private: bool = False,
+    is_excluded: Callable[[tuple[str, ...]], bool] | None = None,
+) -> Iterator[tuple[tuple[str, ...], str, str]]:
     """Recursively collect all modules starting at `module_path`.
 
-    Yields a tuple of parts (e.g. ('top_module', 'sub', 'sub_sub')) and the
-    path where the corresponding documentation file should be written.
+    Yields a tuple of parts (e.g. ('top_module', 'sub', 'sub_sub')), the
+    path where the corresponding documentation file should be written, and
+    the dotted module identifier (e.g. 'top_module.sub.sub_sub', computed
+    once here so consumers don't re-join the parts).
+    If `exclude_private` is True, underscore-prefixed modules (and entire
+    underscore-prefixed subpackages) are pruned during the walk.
+    `is_excluded`, when given, is called with the parts of each subpackage
+    directory (and the root) before descending into it, allowing excluded
+    subtrees to be pruned without ever scanning them.
     """
-    root_module = Path(root_module)
-    for abs_path in sorted(_iter_py_files(root_module, on_implicit_namespace_package)):
-        rel_path = abs_path.relative_to(root_module.parent)
-        doc_path = rel_path.with_suffix(".md")
-        full_doc_path = Path(docs_root, doc_path)
-        parts = tuple(rel_path.with_suffix("").parts)
-
-        if parts[-1] == "__init__":
-            parts = parts[:-1]
-            doc_path = doc_path.with_name("index.md")
-            full_doc_path = full_doc_path.with_name("index.md")
+    # plain string operations here, rather than pathlib arithmetic, avoid
+    # several PurePath allocations per discovered module
+    root_module = os.path.normpath(os.fspath(root_module))
+    root_name = os.path.basename(root_module)
+    if exclude_private and root_name[:1] == "_":
+        return
+    if is_excluded is not None and is_excluded((root_name,)):
+        logger.info("Excluding   %r due to config.exclude", root_name)
+        return
+    for dir_parts, stem in _iter_py_files(
+        root_module,
+        on_implicit_namespace_package,
+        exclude_private=exclude_private,
+        is_excluded=is_excluded,
+        _parts=(root_name,),
+    ):
+        if stem == "__init__":
+            parts = dir_parts
+            tail = "index.md"
+        else:
+            parts = (*dir_parts, stem)
+            tail = stem + ".md"
         if parts[-1] == "index":
             # deal with the special case of a module named 'index.py'
             # we don't want to name it index.md, since that is a special
             # name for a directory index
-            full_doc_path = full_doc_path.with_name("index_py.md")
+            tail = "index_py.md"
 
-        yield parts, str(full_doc_path)
+        yield parts, "/".join((docs_root, *dir_parts, tail)), ".".join(parts)
 
 
 def _iter_py_files(
-    root_module: str | Path, on_implicit_namespace_package: WarnRaiseSkip
-) -> Iterator[Path]:
+    root_module: str | Path,
+    on_implicit_namespace_package: WarnRaiseSkip,
+    *,
+    exclude_private: bool = False,
+    is_excluded: Callable[[tuple[str, ...]], bool] | None = None,
+    _parts: tuple[str, ...] = (),
+) -> Iterator[tuple[tuple[str, ...], str]]:
     """Recursively collect all modules starting at `root_module`.
 
-    Recursively walks from a given root folder, yielding .py files.  Allows special
+    Recursively walks from a given root folder, yielding
+    `(directory parts, module stem)` for each .py file (e.g.
+    `(('pkg', 'sub'), 'mod')` for pkg/sub/mod.py).  Allows special
     handling of implicit namespace packages.
     """
-    root_path = Path(root_module)
+    # os.scandir reuses the metadata returned by the directory read, avoiding
+    # the per-entry stat calls incurred by Path.iterdir()/is_file()/is_dir().
+    # Sorting each directory's entries during the depth-first walk emits paths
+    # in globally sorted order without materializing the entire tree first.
+    # A single pass per directory also provides the implicit-namespace-package
+    # check for free, rather than re-scanning the directory.
+    with os.scandir(root_module) as it:
+        entries = sorted(it, key=lambda e: e.name)
 
     # Skip this directory entirely if it isn't an explicit package.
-    if _is_implicit_namespace_package(root_path):
+    has_init = any(e.name == "__init__.py" and e.is_file() for e in entries)
+    has_py = has_init or any(e.name.endswith(".py") and e.is_file() for e in entries)
+    if not has_init and has_py:
         if on_implicit_namespace_package == "raise":
             raise RuntimeError(
                 f"Implicit namespace package (without an __init__.py file) detected at "
-                f"{root_path}.\nThis will likely cause a collection error in "
+                f"{root_module}.\nThis will likely cause a collection error in "
                 "mkdocstrings.  Set 'on_implicit_namespace_package' to 'skip' to omit "
                 "this package from the documentation, or 'warn' to include it anyway "
                 "but log a warning."
@@ -325,32 +569,59 @@ def _iter_py_files(
                 logger.info(
                     "Skipping implicit namespace package (without an __init__.py file) "
                     "at %s",
-                    root_path,
+                    root_module,
                 )
             else:  # on_implicit_namespace_package == "warn":
                 logger.warning(
                     "Skipping implicit namespace package (without an __init__.py file) "
                     "at %s. Set 'on_implicit_namespace_package' to 'skip' to omit it "
                     "without warning.",
-                    root_path,
+                    root_module,
                 )
             return
-
-    # Yield .py files in the current directory.
-    for item in root_path.iterdir():
-        if item.is_file() and item.suffix == ".py":
-            yield item
-        elif item.is_dir():
-            yield from _iter_py_files(item, on_implicit_namespace_package)
+    for entry in entries:
+        name = entry.name
+        if entry.is_dir():
+            # prune entire private subpackages before descending into them
+            if exclude_private and name[:1] == "_":
+                continue
+            # likewise prune explicitly excluded subpackages at the source
+            if is_excluded is not None and is_excluded((*_parts, name)):
+                logger.debug(
+                    "Excluding   %r due to config.exclude", ".".join((*_parts, name))
+                )
+                continue
+            yield from _iter_py_files(
+                entry.path,
+                on_implicit_namespace_package,
+                exclude_private=exclude_private,
+                is_excluded=is_excluded,
+                _parts=(*_parts, name),
+            )
+        elif name.endswith(".py") and entry.is_file():
+            if exclude_private and name[:1] == "_" and name != "__init__.py":
+                continue
+            yield _parts, name[:-3]
 
 
-def _is_implicit_namespace_package(path: Path) -> bool:
-    """Return True if the given path is an implicit namespace package.
+def _tree_fingerprint(roots: Sequence[str | Path]) -> int:
+    """Hash the names and mtimes of everything under each module root.
 
-    An implicit namespace package is a directory that does not contain an
-    __init__.py file, but *does* have python files in it.
+    Used to decide whether discovery results cached from a previous
+    `mkdocs serve` rebuild are still valid.
     """
-    return not (path / "__init__.py").is_file() and any(path.glob("*.py"))
+    items: list[tuple[str, float]] = []
+    for root in roots:
+        for dirpath, _dirnames, filenames in os.walk(root):
+            try:
+                items.append((dirpath, os.path.getmtime(dirpath)))
+                for name in filenames:
+                    if name.endswith(".py"):
+                        path = os.path.join(dirpath, name)
+                        items.append((path, os.path.getmtime(path)))
+            except OSError:  # pragma: no cover
+                continue
+    return hash(tuple(items))
 
 
 def _merge_nav(
@@ -373,19 +644,23 @@ def _merge_nav(
         not changed it).
     """
     # look for existing nav items that match the API header
-    for position, item in enumerate(list(cfg_nav)):
+    # (no defensive copy needed: the loop only assigns at a single index
+    # and returns, it never inserts or removes while iterating)
+    for position, item in enumerate(cfg_nav):
         if isinstance(item, str) and item == nav_section_title:
             # someone simply placed the string ref... replace with full nav dict
             cfg_nav[position] = {nav_section_title: nav_dict}
             return
 
         if isinstance(item, dict):
-            name, value = next(iter(item.items()))
+            # peek at the (single) key without materializing an items() view
+            name = next(iter(item))
             if name != nav_section_title:
                 continue  # pragma: no cover
 
             # if we get here, it means that the API section already exists
             # we need to merge in our navigation info
+            value = item[name]
             if isinstance(value, str):
                 # The section exists and it is a single string, perhaps
                 # associated with literate-nav-type items to come later?
@@ -423,56 +698,99 @@ def _merge_nav(
     cfg_nav.append({nav_section_title: nav_dict})
 
 
-@dataclass
 class _NavNode:
-    """Simple helper node used while building the navigation tree."""
+    """Simple helper node used while building the navigation tree.
 
-    doc_path: str | None = None
-    children: dict[str, _NavNode] = field(default_factory=dict)
-    name_prefix: str = ""
-    file: File | None = None
-    title: str = ""
-    show_full_namespace: bool = False
+    One node is created per module (and intermediate package); __slots__
+    keeps per-node memory low for packages with thousands of modules.
+    """
+
+    __slots__ = (
+        "_full_title",
+        "children",
+        "doc_path",
+        "file",
+        "name_prefix",
+        "show_full_namespace",
+        "title",
+    )
+
+    def __init__(
+        self,
+        doc_path: str | None = None,
+        children: dict[str, _NavNode] | None = None,
+        name_prefix: str = "",
+        file: File | None = None,
+        title: str = "",
+        show_full_namespace: bool = False,
+    ) -> None:
+        self.doc_path = doc_path
+        self.children: dict[str, _NavNode] = {} if children is None else children
+        self.name_prefix = name_prefix
+        self.file = file
+        self.title = title
+        self.show_full_namespace = show_full_namespace
+        self._full_title: str | None = None
 
     def as_dict(self) -> dict:
-        return {
-            f"{self.name_prefix}{name}": node.as_obj()
-            for name, node in self.children.items()
-        }
+        return {node.full_title: node.as_obj() for node in self.children.values()}
 
     def add_path(self, parts: tuple[str, ...], doc_path: str, file: File) -> None:
         """Add a path to the tree."""
         node = self
-        for part in parts:
-            if part not in node.children:
-                title = ".".join(parts) if self.show_full_namespace else part
-                node.children[part] = _NavNode(
+        for i, part in enumerate(parts):
+            # single lookup (rather than `in` check + subscript), and only
+            # construct a new node (and its title) on a miss
+            child = node.children.get(part)
+            if child is None:
+                # interior nodes get the dotted path *up to their level*,
+                # not the full path of whichever module created them
+                title = ".".join(parts[: i + 1]) if self.show_full_namespace else part
+                child = _NavNode(
                     name_prefix=node.name_prefix,
                     file=file,
                     title=title,
                     show_full_namespace=node.show_full_namespace,
                 )
-            node = node.children[part]
+                node.children[part] = child
+            node = child
         node.doc_path = doc_path
 
     def as_obj(self) -> list | str:
-        """Convert the tree to nested list/dict form."""
+        """Convert the tree to nested list/dict form.
+
+        A post-order walk with an explicit stack avoids one Python frame per
+        node when serializing deeply nested navigation trees.
+        """
         if not self.children:
             return self.doc_path or ""
 
-        # Has children -> return a list
-        result: list[str | dict[str, str | list]] = []
-        if self.doc_path:
-            # Put the doc_path first, if it exists
-            result.append(self.doc_path)
-
-        # Then each child is {child_name: child_structure}
-        # (in insertion order or sorted—here we just rely on insertion order)
-        for child_node in self.children.values():
-            result.append({child_node.full_title: child_node.as_obj()})
-        return result
+        results: dict[int, list | str] = {}
+        stack: list[tuple[_NavNode, bool]] = [(self, False)]
+        while stack:
+            node, visited = stack.pop()
+            if not node.children:
+                results[id(node)] = node.doc_path or ""
+            elif not visited:
+                stack.append((node, True))
+                stack.extend((child, False) for child in node.children.values())
+            else:
+                # all children have been resolved; assemble this node
+                result: list[str | dict[str, str | list]] = []
+                if node.doc_path:
+                    # Put the doc_path first, if it exists
+                    result.append(node.doc_path)
+
+                # Then each child is {child_name: child_structure}
+                # (in insertion order or sorted—here we just rely on insertion order)
+                for child in node.children.values():
+                    result.append({child.full_title: results[id(child)]})
+                results[id(node)] = result
+        return results[id(self)]
 
     @property
     def full_title(self) -> str:
-        """Return the full title of the node."""
-        return self.name_prefix + self.title
+        """Return the full title of the node (cached on first access)."""
+        if self._full_title is None:
+            self._full_title = self.name_prefix + self.title
+        return self._full_title
@@ -0,0 +1,13 @@
+"""Shared test configuration.
+
+Importing the plugin stack up front warms ``sys.modules`` once per test
+process, so each test's in-process ``mkdocs build`` pays the heavy
+mkdocstrings/griffe import cost a single time instead of inside the
+first ``load_config`` call of every test.
+"""
+
+import mkdocs.commands.build
+import mkdocs.contrib.search  # noqa: F401
+import mkdocstrings  # noqa: F401
+
+import mkdocs_api_autonav.plugin  # noqa: F401
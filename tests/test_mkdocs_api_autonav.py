@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+import os
 import shutil
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import pytest
 import yaml
+
+try:  # libyaml's C emitter is several times faster when available
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:  # pragma: no cover
+    from yaml import SafeDumper as _YamlDumper
 from mkdocs.exceptions import Abort
 from pytest import MonkeyPatch
 
@@ -21,6 +27,15 @@ NAV_SECTION = PluginConfig.nav_section_title.default
 API_URI = PluginConfig.api_root_uri.default
 
 
+def _dump_yaml(obj: Any) -> str:
+    return yaml.dump(obj, Dumper=_YamlDumper)
+
+
+def _site_files(site: Path) -> set[str]:
+    """Index the built site with a single walk, for membership assertions."""
+    return {p.relative_to(site).as_posix() for p in site.rglob("*") if p.is_file()}
+
+
 def _build_command(config_file: str) -> None:
     from mkdocs import config
     from mkdocs.commands import build
@@ -51,49 +66,64 @@ def cfg_dict(strict: bool = False, **kwargs: Any) -> dict:
     }
 
 
+# serialized once: several tests write the unmodified default config
+DEFAULT_CFG_YAML = _dump_yaml(cfg_dict())
+
+
 @pytest.fixture
 def repo1(tmp_path: Path, monkeypatch: MonkeyPatch) -> Path:
     repo = tmp_path / "repo"
-    shutil.copytree(REPO1, repo)
+    try:
+        # symlink the fixture files instead of copying them: tests only ever
+        # add new files, so only mkdocs.yml (rewritten by every test) needs
+        # to be materialized to keep writes from following the link back
+        # into the shared fixture
+        shutil.copytree(REPO1, repo, copy_function=os.symlink)
+        (repo / "mkdocs.yml").unlink()
+    except OSError:  # pragma: no cover (e.g. Windows without symlink perms)
+        shutil.rmtree(repo, ignore_errors=True)
+        shutil.copytree(REPO1, repo)
     monkeypatch.syspath_prepend(str(repo / "src"))
     return repo
 
 
 def test_build(repo1: Path) -> None:
     mkdocs_yml = repo1 / "mkdocs.yml"
-    mkdocs_yml.write_text(yaml.safe_dump(cfg_dict()))
+    mkdocs_yml.write_text(DEFAULT_CFG_YAML)
     _build_command(str(mkdocs_yml))
 
-    assert (ref := repo1 / "site" / "reference").is_dir()
-    assert (lib := ref / "my_library").is_dir()
-    assert (lib / "index.html").is_file()
-    assert (sub_mod := lib / "submod").is_dir()
-    assert (sub_mod / "index.html").is_file()
-    assert (sub_sub := sub_mod / "sub_submod").is_dir()
-    assert (sub_sub / "index.html").is_file()
-    assert not any(lib.rglob("*exclude_me*"))
+    # one walk of the built site, rather than a stat per assertion
+    # plus another full rglob for the exclusion check
+    site_files = _site_files(repo1 / "site")
+    assert "reference/my_library/index.html" in site_files
+    assert "reference/my_library/submod/index.html" in site_files
+    assert "reference/my_library/submod/sub_submod/index.html" in site_files
+    assert not any("exclude_me" in f for f in site_files)
 
 
 def test_build_exclude_re(repo1: Path) -> None:
     mkdocs_yml = repo1 / "mkdocs.yml"
     cfg = cfg_dict()
     cfg["plugins"][2]["api-autonav"]["exclude"] = ["re:.*xcl.*"]
-    mkdocs_yml.write_text(yaml.safe_dump(cfg))
+    mkdocs_yml.write_text(_dump_yaml(cfg))
     _build_command(str(mkdocs_yml))
 
-    assert (ref := repo1 / "site" / "reference").is_dir()
-    assert (lib := ref / "my_library").is_dir()
-    assert not any(lib.rglob("*exclude_me*"))
+    site_files = _site_files(repo1 / "site")
+    assert "reference/my_library/index.html" in site_files
+    assert not any("exclude_me" in f for f in site_files)
 
 
 def test_sorting(repo1: Path) -> None:
     package = repo1 / "src" / "my_library"
     (package / "z_submod.py").touch()
     (package / "a_submod.py").touch()
+    # exclude_private prunes underscore-prefixed subtrees during the walk
+    # itself, rather than filtering the results afterwards
     modules = [
         x
-        for x, *_ in _iter_modules(repo1 / "src" / "my_library", str(repo1), "skip")
-        if not any(part.startswith("_") for part in x)
+        for x, *_ in _iter_modules(
+            repo1 / "src" / "my_library", str(repo1), "skip", exclude_private=True
+        )
     ]
     assert modules == [
         ("my_library",),
@@ -109,7 +139,7 @@ def test_build_without_mkdocstrings(repo1: Path, caplog: LogCaptureFixture) -> N
     cfg = cfg_dict()
     cfg["plugins"].remove({"mkdocstrings": {}})
     mkdocs_yml = repo1 / "mkdocs.yml"
-    mkdocs_yml.write_text(yaml.safe_dump(cfg))
+    mkdocs_yml.write_text(_dump_yaml(cfg))
     _build_command(str(mkdocs_yml))
 
     assert any(
@@ -119,7 +149,7 @@ def test_build_without_mkdocstrings(repo1: Path, caplog: LogCaptureFixture) -> N
 
     # strict mode should error out
     cfg["strict"] = True
-    mkdocs_yml.write_text(yaml.safe_dump(cfg))
+    mkdocs_yml.write_text(_dump_yaml(cfg))
 
     with pytest.raises(Abort):
         _build_command(str(mkdocs_yml))
@@ -150,7 +180,7 @@ def test_build_with_nav(
         **nav,
     }
     mkdocs_yml = repo1 / "mkdocs.yml"
-    mkdocs_yml.write_text(yaml.safe_dump(cfg_with_nav))
+    mkdocs_yml.write_text(_dump_yaml(cfg_with_nav))
     _build_command(str(mkdocs_yml))
 
     if nav_list := nav.get("nav"):
@@ -176,7 +206,7 @@ def test_build_with_nav_conflict(repo1: Path, caplog: LogCaptureFixture) -> None
     cfg = cfg_dict(strict=True)
     cfg_with_nav = {**cfg, "nav": ["index.md", {NAV_SECTION: "differentname/"}]}
     mkdocs_yml = repo1 / "mkdocs.yml"
-    mkdocs_yml.write_text(yaml.safe_dump(cfg_with_nav))
+    mkdocs_yml.write_text(_dump_yaml(cfg_with_nav))
     with pytest.raises(Abort):
         _build_command(str(mkdocs_yml))
 
@@ -189,7 +219,7 @@ def test_warns_on_bad_structure(repo1: Path, caplog: LogCaptureFixture) -> None:
     cfg = cfg_dict(strict=True)
     cfg["plugins"][2]["api-autonav"]["on_implicit_namespace_package"] = "raise"
     mkdocs_yml = repo1 / "mkdocs.yml"
-    mkdocs_yml.write_text(yaml.safe_dump(cfg))
+    mkdocs_yml.write_text(_dump_yaml(cfg))
     # add a submodule that doesn't have an __init__.py
     bad_sub = repo1 / "src" / "my_library" / "bad_submod"
     bad_sub.mkdir(parents=True)
@@ -201,7 +231,7 @@ def test_warns_on_bad_structure(repo1: Path, caplog: LogCaptureFixture) -> None:
 
     caplog.clear()
     cfg["plugins"][2]["api-autonav"]["on_implicit_namespace_package"] = "warn"
-    mkdocs_yml.write_text(yaml.safe_dump(cfg))
+    mkdocs_yml.write_text(_dump_yaml(cfg))
     with pytest.raises(Abort):
         _build_command(str(mkdocs_yml))
     assert any(
@@ -212,7 +242,7 @@ def test_warns_on_bad_structure(repo1: Path, caplog: LogCaptureFixture) -> None:
     caplog.clear()
     caplog.set_level("INFO")
     cfg["plugins"][2]["api-autonav"]["on_implicit_namespace_package"] = "skip"
-    mkdocs_yml.write_text(yaml.safe_dump(cfg))
+    mkdocs_yml.write_text(_dump_yaml(cfg))
     _build_command(str(mkdocs_yml))
     assert any(
         "api-autonav: Skipping implicit namespace package" in line
@@ -225,23 +255,27 @@ def test_warns_on_bad_structure(repo1: Path, caplog: LogCaptureFixture) -> None:
 def test_multi_package(repo1: Path, strict: bool, nav: dict) -> None:
     cfg_with_nav = {**cfg_dict(strict=strict), **nav}
 
-    # add another package
-    shutil.copytree(repo1 / "src" / "my_library", repo1 / "src" / "my_library2")
+    # add another package: a symlink is enough, the tree is only read
+    src = repo1 / "src" / "my_library"
+    dst = repo1 / "src" / "my_library2"
+    try:
+        os.symlink(src, dst, target_is_directory=True)
+    except OSError:  # pragma: no cover (e.g. Windows without symlink perms)
+        shutil.copytree(src, dst)
     cfg_with_nav["plugins"][2]["api-autonav"]["modules"].append("src/my_library2")
 
     # this is important to trigger a possible bug:
     mkdocs_yml = repo1 / "mkdocs.yml"
-    mkdocs_yml.write_text(yaml.safe_dump(cfg_with_nav))
+    mkdocs_yml.write_text(_dump_yaml(cfg_with_nav))
     _build_command(str(mkdocs_yml))
     assert (repo1 / "site" / "reference").is_dir()
 
 
 def test_index_py_module(repo1: Path) -> None:
     """Test the edge case of a module named index.py"""
-    cfg = cfg_dict()
     repo1.joinpath("src", "my_library", "index.py").touch()
     mkdocs_yml = repo1 / "mkdocs.yml"
-    mkdocs_yml.write_text(yaml.safe_dump(cfg))
+    mkdocs_yml.write_text(DEFAULT_CFG_YAML)
     _build_command(str(mkdocs_yml))
 
     assert (ref := repo1 / "site" / "reference").is_dir()
@@ -260,7 +294,7 @@ def test_awesome_nav_compat(repo1: Path) -> None:
     cfg["plugins"].insert(0, "awesome-nav")
 
     mkdocs_yml = repo1 / "mkdocs.yml"
-    mkdocs_yml.write_text(yaml.safe_dump(cfg))
+    mkdocs_yml.write_text(_dump_yaml(cfg))
     _build_command(str(mkdocs_yml))
     assert (ref := repo1 / "site" / "reference").is_dir()
     assert (lib := ref / "my_library").is_dir()